@@ -1,4 +1,39 @@
+import re
+import threading
+import requests
+from http.cookiejar import DefaultCookiePolicy
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_local = threading.local()
+
+
+def get_session():
+    """returns this thread's requests.Session, so repeated calls reuse keep-alive connections"""
+    session = getattr(_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        # requests are authorised via headers per Auth, never carry cookies between calls
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        _local.session = session
+    return session
+
+# orjson turns integers beyond 64 bits into floats, leave bodies with 19+ digit
+# integer tokens (which covers everything outside int64/uint64) to stdlib json.
+# float digits are excluded so vector-heavy bodies still take the orjson path.
+_LONG_INTEGER = re.compile(rb"(?<![\d.])-?\d{19,}(?![\d.eE])")
+
+
 def handle_response(response):
+    if orjson is not None and not _LONG_INTEGER.search(response.content):
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            # e.g. NaN/Infinity, which stdlib json accepts
+            pass
     try:
         return response.json()
     except:
@@ -1,18 +1,20 @@
 import os
 import json
 import atexit
-import requests
 from typing import List
 from fastapi.routing import APIRoute
 from relevanceai.auth import config
+from relevanceai._request import get_session
 
 
 def routes_to_tools(api_routes, url, id_suffix=""):
     tools_list = []
     id_list = []
+    base_url = url[:-1] if url.endswith("/") else url
     for route in api_routes:
         if isinstance(route, APIRoute):
-            id_list.append(route.unique_id + id_suffix)
+            tool_id = route.unique_id + id_suffix
+            id_list.append(tool_id)
             input_schema = {}
             request_body = ""
             if route.body_field:
@@ -32,15 +34,12 @@ def routes_to_tools(api_routes, url, id_suffix=""):
                         k
                     ] = f"{{{{ steps.api_call.output.response_body.{k} }}}}"
 
-            if url.endswith("/"):
-                full_path = url[:-1] + route.path
-            else:
-                full_path = url + route.path
+            full_path = base_url + route.path
 
             tools_list.append(
                 {
                     "public": False,
-                    "studio_id": route.unique_id + id_suffix,
+                    "studio_id": tool_id,
                     "params_schema": input_schema,
                     "publicly_triggerable": False,
                     "project": config.auth.project,
@@ -77,7 +76,7 @@ def routes_to_tools(api_routes, url, id_suffix=""):
 
 
 def upload_tools(chains):
-    results = requests.post(
+    results = get_session().post(
         f"{config.auth.url}/latest/studios/bulk_update",
         headers=config.auth.headers,
         json={"updates": chains},
@@ -87,7 +86,7 @@ def upload_tools(chains):
 
 
 def disconnect_tools(chain_id_list):
-    results = requests.post(
+    results = get_session().post(
         f"{config.auth.url}/latest/studios/bulk_delete",
         headers=config.auth.headers,
         json={"ids": chain_id_list},
@@ -99,8 +98,6 @@ def disconnect_tools(chain_id_list):
 def connect_tools(api_routes, url, id_suffix="", cleanup=True, export_json=False):
     chains, chain_id_list = routes_to_tools(api_routes, url, id_suffix=id_suffix)
     if export_json:
-        import json
-
         with open("chain_export.json", "w") as outfile:
             json.dump({"export": chains}, outfile)
     else:
@@ -1,10 +1,9 @@
-import requests
-from relevanceai._request import handle_response
+from relevanceai._request import handle_response, get_session
 from relevanceai import config
 
 def set_key(key:str, value:str):
     url = f"{config.auth.url}/latest"
-    response = requests.post(
+    response = get_session().post(
         f"{url}/projects/keys/set",
         headers=config.auth.headers,
         json={
@@ -17,7 +16,7 @@ def set_key(key:str, value:str):
 
 def list_keys():
     url = f"{config.auth.url}/latest"
-    response = requests.get(
+    response = get_session().get(
         f"{url}/projects/keys/list",
         headers=config.auth.headers,
     )
@@ -26,7 +25,7 @@ def list_keys():
 
 def delete_key(key:str):
     url = f"{config.auth.url}/latest"
-    response = requests.post(
+    response = get_session().post(
         f"{url}/projects/keys/delete",
         headers=config.auth.headers,
         json={
@@ -1,7 +1,6 @@
-import requests
 from relevanceai import config
 from relevanceai.auth import Auth
-from relevanceai._request import handle_response
+from relevanceai._request import handle_response, get_session
 from relevanceai.params import Parameters, ParamBase
 
 
@@ -41,14 +40,14 @@ class StepBase:
 
     def run(self, parameters={}, full_response: bool = False):
         url = f"{self.auth.url}/latest/studios/{self.auth.project}"
-        response = requests.post(
+        response = get_session().post(
             f"{url}/trigger",
             json=self._trigger_json(parameters),
             headers=self.auth.headers,
         )
         res = handle_response(response)
         if isinstance(res, dict):
-            if ("errors" in res and res["errors"]) or full_response:
+            if res.get("errors") or full_response:
                 return res
             elif "output" in res:
                 return res["output"]
@@ -68,7 +67,7 @@ class StepBase:
 
     def deploy(self):
         url = f"{self.auth.url}/latest/studios"
-        response = requests.post(
+        response = get_session().post(
             f"{url}/bulk_update",
             json={"updates": [self._json()]},
             headers=self.auth.headers,
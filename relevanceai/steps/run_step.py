@@ -1,51 +1,73 @@
-import requests
-from relevanceai._request import handle_response
+import copy
+import time
+from relevanceai._request import handle_response, get_session
 from relevanceai.auth import config, Auth
 from relevanceai.steps._base import StepBase
 
 
-def list_all_steps(auth: Auth = None):
-    if auth is None:
-        auth = config.auth
-    response = requests.get(
+TRANSFORMATIONS_TTL = 60
+_transformations_cache = {}
+
+
+def _list_transformations(auth: Auth, refresh: bool = False):
+    """fetches the raw transformation definitions, cached per region for TRANSFORMATIONS_TTL seconds"""
+    cached = _transformations_cache.get(auth.region)
+    if not refresh and cached and time.monotonic() - cached[0] < TRANSFORMATIONS_TTL:
+        return cached[1]
+    response = get_session().get(
         f"https://api-{auth.region}.stack.tryrelevance.com/latest/studios/transformations/list",
     )
     res = handle_response(response)
+    transformations = res["transformations"]
+    _transformations_cache[auth.region] = (time.monotonic(), transformations)
+    return transformations
+
+
+def list_all_steps(auth: Auth = None, refresh: bool = False):
+    if auth is None:
+        auth = config.auth
     results_list = []
-    for s in res["transformations"]:
+    for s in _list_transformations(auth, refresh=refresh):
         results_list.append(
             {
                 "id": s["transformation_id"],
                 "name": s["name"],
                 "description": s["description"],
-                "input_schema": s["input_schema"]["properties"].keys(),
-                "output_schema": s["output_schema"]["properties"].keys(),
-                "required": s["input_schema"]["required"]
-                if "required" in s["input_schema"]
-                else [],
+                "input_schema": list(s["input_schema"]["properties"]),
+                "output_schema": list(s["output_schema"]["properties"]),
+                "required": list(s["input_schema"].get("required", [])),
             }
         )
     return results_list
 
 
 class RunStep(StepBase):
-    def __init__(self, step_id: str, step_name: str = None, *args, **kwargs):
-        self.list_of_steps = list_all_steps()
+    def __init__(
+        self,
+        step_id: str,
+        step_name: str = None,
+        *args,
+        refresh: bool = False,
+        **kwargs,
+    ):
+        auth = config.auth if kwargs.get("auth") is None else kwargs["auth"]
+        self.list_of_steps = list_all_steps(auth, refresh=refresh)
         self.step_id = step_id
-        for step in self.list_of_steps:
+        for step in _list_transformations(auth):
             if step["transformation_id"] == self.step_id:
-                self.step_definition = step
+                # copy so changes to this step never leak into the shared cache
+                self.step_definition = copy.deepcopy(step)
+                break
+        else:
+            raise ValueError(
+                f"Step {self.step_id} not found, use list_all_steps() to see available steps."
+            )
         self.step_name = (
             self.step_definition["name"] if step_name is None else step_name
         )
-        self._inputs = [
-            t for t in self.step_definition["input_schema"]["properties"].keys()
-        ]
-        self._required = (
-            self.step_definition["input_schema"]["required"]
-            if "required" in self.step_definition["input_schema"]
-            else []
-        )
+        input_schema = self.step_definition["input_schema"]
+        self._inputs = list(input_schema["properties"])
+        self._required = input_schema.get("required", [])
 
         self.inputted = []
         for r in self._required:
@@ -1,6 +1,6 @@
 import json
-import requests
-from relevanceai._request import handle_response
+import uuid
+from relevanceai._request import handle_response, get_session
 from relevanceai import config
 from relevanceai.auth import Auth
 from relevanceai.params import Parameters
@@ -18,7 +18,7 @@ def load(id, auth=None):
     """loads a chain via id"""
     if auth is None:
         auth = config.auth
-    response = requests.get(
+    response = get_session().get(
         f"{auth.url}/latest/studios/{auth.project}/{id}",
         json={
             "filters": [
@@ -82,8 +82,6 @@ class Tool:
         # generate random id if none provided
         self.random_id = False
         if id is None:
-            import uuid
-
             id = str(uuid.uuid4())
             self.random_id = True
         self.id = id
@@ -103,13 +101,13 @@ class Tool:
 
     def _transform_steps(self, steps):
         tool_steps = [step.steps[0] for step in steps]
-        unique_ids = []
+        unique_ids = set()
         for step in tool_steps:
             if step["name"] in unique_ids:
                 raise ValueError(
                     f"Duplicate step name {step['name']}, please rename the step name with Step(step_name=step_name)."
                 )
-            unique_ids.append(step["name"])
+            unique_ids.add(step["name"])
         return tool_steps
 
     def _trigger_json(
@@ -130,14 +128,14 @@ class Tool:
 
     def run(self, parameters={}, full_response: bool = False):
         url = f"{self.auth.url}/latest/studios/{self.auth.project}"
-        response = requests.post(
+        response = get_session().post(
             f"{url}/trigger",
             json=self._trigger_json(parameters),
             headers=self.auth.headers,
         )
         res = handle_response(response)
         if isinstance(res, dict):
-            if ("errors" in res and res["errors"]) or full_response:
+            if res.get("errors") or full_response:
                 return res
             elif "output" in res:
                 return res["output"]
@@ -161,7 +159,7 @@ class Tool:
 
     def deploy(self):
         url = f"{self.auth.url}/latest/studios"
-        response = requests.post(
+        response = get_session().post(
             f"{url}/bulk_update",
             json={"updates": [self._json()]},
             headers=self.auth.headers,
@@ -1,18 +1,24 @@
 import io
 import os
-import requests
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 from relevanceai.auth import config
+from relevanceai._request import get_session
+
+
+def _is_url(content):
+    return isinstance(content, str) and content.startswith(("http://", "https://"))
 
 
 def _get_content_bytes(content):
     if isinstance(content, str):
-        if "http" in content and "/":
+        if _is_url(content):
             # online image
-            content_bytes = io.BytesIO(requests.get(content).content).getvalue()
+            content_bytes = get_session().get(content).content
         else:
             # local filepath
-            content_bytes = io.BytesIO(open(content, "rb").read()).getvalue()
+            with open(content, "rb") as f:
+                content_bytes = f.read()
     elif isinstance(content, bytes):
         content_bytes = content
     elif isinstance(content, io.BytesIO):
@@ -23,7 +29,7 @@ def _get_content_bytes(content):
 
 
 def _get_file_upload_urls(dataset_id: str, files: List[str]):
-    response = requests.post(
+    response = get_session().post(
         url=f"{config.auth.url}/latest/datasets/{dataset_id}/get_file_upload_urls",
         headers=config.auth.headers,
         json={"files": files},
@@ -41,15 +47,27 @@ def _upload_media(presigned_url: str, media_content: bytes):
         raise ValueError(
             f"media needs to be in a bytes format. Currently in {type(media_content)}"
         )
-    return requests.put(
+    return get_session().put(
         presigned_url,
         data=media_content,
     )
 
 
 def upload(data, dataset_id: str, filename: str = "temp"):
-    data_bytes = _get_content_bytes(data)
-    presigned_response = _get_file_upload_urls(dataset_id=dataset_id, files=[filename])
+    if _is_url(data):
+        # downloading the content and requesting the upload url are independent, overlap them
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            data_future = executor.submit(_get_content_bytes, data)
+            presigned_response = _get_file_upload_urls(
+                dataset_id=dataset_id, files=[filename]
+            )
+            data_bytes = data_future.result()
+    else:
+        # read (and validate) local content before making any request
+        data_bytes = _get_content_bytes(data)
+        presigned_response = _get_file_upload_urls(
+            dataset_id=dataset_id, files=[filename]
+        )
     response = _upload_media(
         presigned_url=presigned_response["files"][0]["upload_url"],
         media_content=data_bytes,
@@ -17,5 +17,5 @@ setup(
     setup_requires=["wheel"],
     install_requires=core_reqs,
     package_data={"": ["*.ini"]},
-    extras_require=dict(),
+    extras_require=dict(fast=["orjson"]),
 )
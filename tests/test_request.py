@@ -0,0 +1,81 @@
+import json
+import random
+import threading
+
+import pytest
+
+from relevanceai import _request
+from relevanceai._request import get_session, handle_response
+
+
+class FakeResponse:
+    def __init__(self, content: bytes):
+        self.content = content
+        self.text = content.decode()
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class OrjsonOnlyResponse(FakeResponse):
+    def json(self):
+        raise AssertionError("fell back to stdlib json")
+
+
+def test_vector_body_uses_orjson():
+    pytest.importorskip("orjson")
+    random.seed(0)
+    docs = [
+        {"_id": str(i), "vector_": [random.random() for _ in range(768)]}
+        for i in range(20)
+    ]
+    body = json.dumps({"documents": docs}).encode()
+    assert _request._LONG_INTEGER.search(body) is None
+    assert handle_response(OrjsonOnlyResponse(body)) == {"documents": docs}
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        123456789012345678901234567890,
+        -9223372036854775809,
+        18446744073709551616,
+    ],
+)
+def test_out_of_range_integers_keep_precision(value):
+    assert handle_response(FakeResponse(b'{"a": %d}' % value)) == {"a": value}
+
+
+def test_nan_falls_back_to_stdlib_json():
+    res = handle_response(FakeResponse(b'{"output": NaN}'))
+    assert isinstance(res, dict)
+    assert res["output"] != res["output"]
+
+
+def test_invalid_json_returns_text():
+    assert handle_response(FakeResponse(b"not json")) == "not json"
+
+
+def test_session_is_reused_within_a_thread():
+    assert get_session() is get_session()
+
+
+def test_session_is_not_shared_across_threads():
+    sessions = []
+    thread = threading.Thread(target=lambda: sessions.append(get_session()))
+    thread.start()
+    thread.join()
+    assert sessions[0] is not get_session()
+
+
+def test_session_rejects_cookies():
+    import requests
+
+    cookie = requests.cookies.create_cookie(
+        "sid", "1", domain="api-us.stack.tryrelevance.com"
+    )
+    policy = get_session().cookies._policy
+    request = requests.Request(
+        "GET", "https://api-us.stack.tryrelevance.com/latest"
+    ).prepare()
+    assert not policy.set_ok(cookie, requests.cookies.MockRequest(request))
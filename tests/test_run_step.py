@@ -0,0 +1,67 @@
+import copy
+import json
+
+import pytest
+
+from relevanceai.auth import Auth
+from relevanceai.steps import run_step
+from relevanceai.steps.run_step import RunStep, list_all_steps
+
+AUTH = Auth("key", "us", "project")
+
+
+def _transformations():
+    return [
+        {
+            "transformation_id": "prompt_completion",
+            "name": "llm",
+            "description": "Run an LLM",
+            "input_schema": {"properties": {"prompt": {}}},
+            "output_schema": {"properties": {"answer": {}}},
+        }
+    ]
+
+
+@pytest.fixture
+def requests_made(monkeypatch):
+    requests_made = []
+
+    class FakeSession:
+        def get(self, url, **kwargs):
+            requests_made.append(url)
+            body = json.dumps({"transformations": _transformations()}).encode()
+            return type(
+                "Response",
+                (),
+                {"content": body, "text": body.decode(), "json": lambda self: json.loads(body)},
+            )()
+
+    monkeypatch.setattr(run_step, "get_session", lambda: FakeSession())
+    monkeypatch.setattr(run_step, "_transformations_cache", {})
+    return requests_made
+
+
+def test_transformations_are_cached(requests_made):
+    list_all_steps(AUTH)
+    RunStep("prompt_completion", auth=AUTH)
+    assert len(requests_made) == 1
+
+
+def test_refresh_refetches(requests_made):
+    list_all_steps(AUTH)
+    RunStep("prompt_completion", auth=AUTH, refresh=True)
+    assert len(requests_made) == 2
+
+
+def test_mutating_a_step_does_not_touch_the_cache(requests_made):
+    step = RunStep("prompt_completion", auth=AUTH)
+    step.step_definition["name"] = "changed"
+    step.list_of_steps[0]["input_schema"].append("extra")
+    assert list_all_steps(AUTH)[0]["name"] == "llm"
+    assert list_all_steps(AUTH)[0]["input_schema"] == ["prompt"]
+    assert len(requests_made) == 1
+
+
+def test_run_step_can_be_deep_copied(requests_made):
+    step = RunStep("prompt_completion", auth=AUTH)
+    assert copy.deepcopy(step).steps == step.steps
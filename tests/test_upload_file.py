@@ -0,0 +1,51 @@
+import pytest
+
+from relevanceai import upload_file
+from relevanceai.auth import Auth, config
+
+
+class FakeSession:
+    def __init__(self, calls):
+        self.calls = calls
+
+    def get(self, url, **kwargs):
+        self.calls.append(("get", url))
+        return type("Response", (), {"content": b"remote"})()
+
+    def post(self, url, **kwargs):
+        self.calls.append(("post", url))
+        files = [{"upload_url": "https://upload", "url": "https://file"}]
+        return type("Response", (), {"json": lambda self: {"files": files}})()
+
+    def put(self, url, data=None, **kwargs):
+        self.calls.append(("put", data))
+        return type("Response", (), {"status_code": 200})()
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    calls = []
+    monkeypatch.setattr(upload_file, "get_session", lambda: FakeSession(calls))
+    monkeypatch.setattr(config, "_auth", Auth("key", "us", "project"))
+    return calls
+
+
+@pytest.mark.parametrize(
+    "data, error", [(123, TypeError), ("/nonexistent/file", FileNotFoundError)]
+)
+def test_invalid_content_makes_no_request(calls, data, error):
+    with pytest.raises(error):
+        upload_file.upload(data, "dataset")
+    assert calls == []
+
+
+def test_upload_bytes(calls):
+    assert upload_file.upload(b"local", "dataset") == "https://file"
+    assert [c[0] for c in calls] == ["post", "put"]
+    assert calls[-1] == ("put", b"local")
+
+
+def test_upload_url(calls):
+    assert upload_file.upload("https://example.com/a.png", "dataset") == "https://file"
+    assert ("get", "https://example.com/a.png") in calls
+    assert calls[-1] == ("put", b"remote")